@@ -4,14 +4,39 @@ Generate all app icons (Android adaptive icons and Linux icons) from a single SV
 This creates foreground, background, and monochrome layers for Android's adaptive icon system,
 as well as Linux desktop icons.
 
-Usage: python3 generate_app_icons.py [path/to/icon.svg]
+Usage: python3 generate_app_icons.py [--force] [path/to/icon.svg]
+
+Outputs newer than their source SVG (and this script) are left alone unless
+--force is given. Passing an SVG path always rebuilds the icons made from it,
+since the outputs don't record which SVG they came from.
+
+If Pillow is installed, each SVG is rasterized once and the smaller sizes are
+downscaled from it; otherwise the SVG converter is run for every size.
+If oxipng is on the PATH the generated PNGs are losslessly recompressed.
 """
 
+import argparse
+import functools
+import io
+import os
+import re
 import subprocess
 import sys
 import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow is optional, without it every size goes through the converter
+    Image = ImageOps = None
+
+try:
+    import cairosvg
+except (ImportError, OSError):  # cairosvg also needs the cairo shared library
+    cairosvg = None
+
 # Configuration
 DEFAULT_SVG = "assets/icons/nhac.svg"
 FOREGROUND_SVG = "assets/icons/fgnhac.svg"  # White play buttons only
@@ -19,147 +44,416 @@ FOREGROUND_SVG = "assets/icons/fgnhac.svg"  # White play buttons only
 # Linux icon sizes
 LINUX_SIZES = [64, 128, 256, 512]
 
+# Notification icons need to be in drawable folders at specific sizes
+NOTIFICATION_SIZES = {
+    'drawable-mdpi': 24,
+    'drawable-hdpi': 36,
+    'drawable-xhdpi': 48,
+    'drawable-xxhdpi': 72,
+    'drawable-xxxhdpi': 96
+}
+
+# An SVG document starts with an XML declaration or the <svg> element
+SVG_START_RE = re.compile(rb'\s*<(?:\?xml|svg)')
+
+# Upper bound on concurrent converter processes (inkscape/magick can be memory hungry)
+MAX_RENDER_WORKERS = 8
+
+
+def _render(svg_data, size, converter, compress_level=9):
+    """Rasterize SVG bytes to a PNG of the given size.
+
+    The SVG is fed through stdin and the PNG read back from stdout, so nothing
+    touches the disk until the caller writes the result. Stderr is only decoded
+    when the converter fails. compress_level is honoured where the converter
+    allows it; use 0 for images that are decoded straight away.
+    Inkscape is not handled here, it goes through InkscapeShell instead.
+    Module-level so it can be dispatched to worker processes.
+    """
+    if converter == 'cairosvg':
+        # In-process rendering, no fork/exec of an external tool
+        png_data = cairosvg.svg2png(
+            bytestring=svg_data,
+            output_width=size,
+            output_height=size
+        )
+        return png_data
+
+    if converter == 'rsvg-convert':
+        cmd = [
+            'rsvg-convert',
+            '-a',  # Keep aspect ratio, fitting inside the box
+            '-w', str(size),
+            '-h', str(size)
+        ]
+    else:  # magick
+        # Scale the density with the target size instead of a fixed 300 DPI.
+        # The size/2 ratio is tuned for the bundled ~150mm SVGs (about 3x
+        # oversampling for the Lanczos resize); much smaller or larger custom
+        # artwork gets proportionally less or more.
+        density = max(72, size // 2)
+        cmd = [
+            'magick',
+            '-density', str(density),
+            '-background', 'none',
+            'svg:-',
+            '-filter', 'Lanczos',
+            '-resize', f'{size}x{size}',
+            '-define', f'png:compression-level={compress_level}',
+            'png:-'
+        ]
+
+    try:
+        result = subprocess.run(cmd, input=svg_data, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"{cmd[0]} failed: {e.stderr.decode(errors='replace').strip()}") from e
+    return result.stdout
+
+
+def _optimize_png(png_data):
+    """Losslessly recompress PNG bytes with oxipng, keeping the input if it fails."""
+    result = subprocess.run(
+        ['oxipng', '-o', '2', '--quiet', '--stdout', '-'],
+        input=png_data,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+    if result.returncode != 0 or not result.stdout:
+        return png_data
+    return result.stdout
+
+
+def _link_or_copy(src, dst, fallback_data=None):
+    """Hardlink dst to src, falling back to a copy (e.g. across filesystems).
+
+    If fallback_data is given the copy is written from it instead of re-reading src.
+    """
+    if dst.exists() and os.path.samefile(src, dst):
+        # Already linked (or dst is the source itself), unlinking would lose it
+        return
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        if fallback_data is None:
+            shutil.copy(src, dst)
+        else:
+            dst.write_bytes(fallback_data)
+
+
+class InkscapeShell:
+    """A single `inkscape --shell` session that exports many PNGs.
+
+    Inkscape takes a second or two to start, so reusing one process beats
+    launching it for every conversion.
+    """
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            ['inkscape', '--shell'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+        self.wait_for_prompt()
+
+    def wait_for_prompt(self):
+        """Read shell output until Inkscape is ready for the next command."""
+        output = ''
+        while output != '> ' and not output.endswith('\n> '):
+            char = self.process.stdout.read(1)
+            if not char:
+                raise RuntimeError(f"Inkscape shell exited unexpectedly: {output.strip()}")
+            output += char
+        return output
+
+    def export(self, svg_path, size, output_path):
+        """Export an SVG file to a PNG of the given size."""
+        self.process.stdin.write(
+            f"file-open:{svg_path}; export-filename:{output_path}; "
+            f"export-width:{size}; export-height:{size}; export-do; file-close\n"
+        )
+        self.process.stdin.flush()
+        self.wait_for_prompt()
+
+    def close(self):
+        """Quit the shell."""
+        if self.process.poll() is None:
+            self.process.communicate("quit\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
 
 class IconGenerator:
-    def __init__(self, svg_path):
+    def __init__(self, svg_path, force=False):
         self.project_root = Path(__file__).parent
+        self.script_mtime = Path(__file__).stat().st_mtime
+        self.force = force
         self.svg_path = Path(svg_path) if svg_path else self.project_root / DEFAULT_SVG
+        self.svg_path_given = svg_path is not None
         self.foreground_svg_path = self.project_root / FOREGROUND_SVG
         self.android_res = self.project_root / "android/app/src/main/res"
         self.linux_icons = self.project_root / "linux/icons"
-        self.temp_dir = self.project_root / "temp_icons"
+        self._svg_data = {}
+        self._source_mtimes = {}
+        self._log = []
 
         # Check that required SVG files exist
         if not self.foreground_svg_path.exists():
             raise FileNotFoundError(f"Foreground SVG file not found: {self.foreground_svg_path}")
 
-        print(f"Using SVG: {self.svg_path}")
-        print(f"Using foreground SVG: {self.foreground_svg_path}")
+        self.log(f"Using SVG: {self.svg_path}")
+        self.log(f"Using foreground SVG: {self.foreground_svg_path}")
 
         # Check for available SVG converters
         self.svg_converter = self.detect_svg_converter()
-        print(f"Using SVG converter: {self.svg_converter}")
+        self.log(f"Using SVG converter: {self.svg_converter}")
+        self.flush_log()
     
-    def detect_svg_converter(self):
+    def log(self, message):
+        """Queue a progress message, flush_log() writes the queue in one go."""
+        self._log.append(message)
+
+    def flush_log(self):
+        """Write all queued progress messages with a single write."""
+        if self._log:
+            sys.stdout.write('\n'.join(self._log) + '\n')
+            sys.stdout.flush()
+            self._log.clear()
+
+    @classmethod
+    @functools.cache
+    def detect_svg_converter(cls):
         """Detect the best available SVG to PNG converter."""
-        converters = [
-            ('rsvg-convert', ['rsvg-convert', '--version']),
-            ('inkscape', ['inkscape', '--version']),
-            ('magick', ['magick', '-version'])
-        ]
-        
-        for name, check_cmd in converters:
-            try:
-                subprocess.run(check_cmd, capture_output=True, check=True)
+        if cairosvg is not None:
+            return 'cairosvg'
+
+        # A PATH lookup is enough, no need to launch each tool with --version
+        for name in ['rsvg-convert', 'inkscape', 'magick']:
+            if shutil.which(name):
                 return name
-            except:
-                continue
         
         # Default to magick as it's most likely to be available
         return 'magick'
     
     def setup(self):
-        """Create necessary directories."""
-        self.temp_dir.mkdir(exist_ok=True)
-        self.linux_icons.mkdir(parents=True, exist_ok=True)
-    
-    def cleanup(self):
-        """Remove temporary files."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+        """Create every output directory up front, before any rendering starts."""
+        output_dirs = [self.linux_icons]
+        output_dirs += [self.android_res / folder for folder in NOTIFICATION_SIZES]
+        for output_dir in output_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
     
-    def convert_svg_to_png_path(self, svg_path, size, output_path):
-        """Convert specific SVG file to PNG at given size."""
+    def source_mtime(self, src):
+        """Modification time of a source file, stat'ed once per run."""
+        if src not in self._source_mtimes:
+            self._source_mtimes[src] = max(os.stat(src).st_mtime, self.script_mtime)
+        return self._source_mtimes[src]
+
+    def needs_rebuild(self, src, dst):
+        """Check whether dst is missing or older than src or this script.
+
+        An explicitly given SVG may carry an old mtime (cp -p, tarballs, another
+        branch), so its outputs are always rebuilt.
+        """
+        if self.force or (self.svg_path_given and src == self.svg_path):
+            return True
+        try:
+            dst_mtime = os.stat(dst).st_mtime
+        except FileNotFoundError:
+            return True
+        return dst_mtime < self.source_mtime(src)
+
+    def load_svg(self, svg_path):
+        """Read and validate an SVG file, caching its bytes for later conversions."""
+        if svg_path in self._svg_data:
+            return self._svg_data[svg_path]
+
         if not svg_path.exists():
             raise FileNotFoundError(f"SVG file not found: {svg_path}")
 
-        # Read and validate SVG content
-        with open(svg_path, 'r') as f:
-            svg_content = f.read()
+        svg_data = svg_path.read_bytes()
 
-        if not svg_content.strip().startswith('<?xml') and not svg_content.strip().startswith('<svg'):
+        if not SVG_START_RE.match(svg_data):
             raise ValueError(f"Invalid SVG content in {svg_path}")
 
-        if self.svg_converter == 'rsvg-convert':
-            cmd = [
-                'rsvg-convert',
-                '-a',  # Keep aspect ratio
-                '-w', str(size),
-                '-h', str(size),
-                str(svg_path),
-                '-o', str(output_path)
-            ]
-        elif self.svg_converter == 'inkscape':
-            cmd = [
-                'inkscape',
-                str(svg_path),
-                '--export-type=png',
-                f'--export-filename={output_path}',
-                f'--export-width={size}',
-                f'--export-height={size}'
-            ]
-        else:  # magick
-            cmd = [
-                'magick',
-                '-density', '300',
-                '-background', 'none',
-                str(svg_path),
-                '-resize', f'{size}x{size}',
-                str(output_path)
-            ]
-
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        if result.stderr:
-            print(f"Warning: {result.stderr}")
-
-        return output_path
-
-    def create_notification_icon(self):
-        """Create notification icon using the foreground SVG."""
-        print("  Creating notification icons...")
+        self._svg_data[svg_path] = svg_data
+        return svg_data
+
+    def rasterize(self, sources, compress_level=9):
+        """Render (svg_path, size) pairs to PNG bytes, in parallel where possible."""
+        if self.svg_converter == 'inkscape':
+            # One shell handles the whole batch, no point starting more Inkscapes.
+            # Shell exports can only go to a file, so read them back from a temp dir.
+            results = []
+            with InkscapeShell() as shell, tempfile.TemporaryDirectory() as temp_dir:
+                for svg_path, size in sources:
+                    self.load_svg(svg_path)
+                    output_path = Path(temp_dir) / f"{svg_path.stem}-{size}.png"
+                    shell.export(svg_path, size, output_path)
+                    # The shell keeps going after a failed export, so check for the file
+                    if not output_path.exists():
+                        raise RuntimeError(f"inkscape failed to export {svg_path} at {size}px")
+                    results.append(output_path.read_bytes())
+            return results
+
+        svg_data = [self.load_svg(svg_path) for svg_path, _ in sources]
+        sizes = [size for _, size in sources]
+        converters = [self.svg_converter] * len(sources)
+        levels = [compress_level] * len(sources)
+        workers = min(len(sources), os.cpu_count() or 1, MAX_RENDER_WORKERS)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_render, svg_data, sizes, converters, levels))
+
+    def write_icon(self, png_data, output_paths):
+        """Write PNG bytes once and hardlink the remaining output paths to it."""
+        first, *others = output_paths
+        first.write_bytes(png_data)
+        self.log(f"  Created: {first}")
+
+        for output_path in others:
+            _link_or_copy(first, output_path, fallback_data=png_data)
+            self.log(f"  Created: {output_path}")
+
+    def rasterize_masters(self, targets):
+        """Render each SVG once at its largest target size and load it with Pillow."""
+        sources = [(svg_path, max(size for size, _ in outputs)) for svg_path, outputs in targets.items()]
+
+        masters = {}
+        # Masters are decoded right away, so don't spend time compressing them
+        for (svg_path, _), png_data in zip(sources, self.rasterize(sources, compress_level=0)):
+            with Image.open(io.BytesIO(png_data)) as img:
+                masters[svg_path] = img.convert('RGBA')
+        return masters
+
+    def render_icons(self, jobs):
+        """Produce icons from (svg_path, size, output_paths) jobs.
+
+        Jobs whose outputs are all up to date are skipped.
+        """
+        # Validate sources first so a missing SVG reports as such, not as a failed stat
+        for svg_path in {svg_path for svg_path, _, _ in jobs}:
+            self.load_svg(svg_path)
+
+        jobs = [
+            (svg_path, size, output_paths) for svg_path, size, output_paths in jobs
+            if any(self.needs_rebuild(svg_path, output_path) for output_path in output_paths)
+        ]
+        if not jobs:
+            self.log("  All icons up to date")
+            return
+
+        self.write_icons(self.iter_icons(jobs))
+
+    def iter_icons(self, jobs):
+        """Yield (png_data, output_paths) for each job as soon as it is ready.
+
+        With Pillow available each SVG is rasterized once and every size is a
+        Lanczos downscale of that master; otherwise each size is converted
+        separately.
+        """
+        if Image is None:
+            sources = [(svg_path, size) for svg_path, size, _ in jobs]
+            for (_, _, output_paths), png_data in zip(jobs, self.rasterize(sources)):
+                yield png_data, output_paths
+            return
+
+        targets = {}
+        for svg_path, size, output_paths in jobs:
+            targets.setdefault(svg_path, []).append((size, output_paths))
+
+        masters = self.rasterize_masters(targets)
+        lanczos = Image.Resampling.LANCZOS
+        for svg_path, outputs in targets.items():
+            # Every size is resized straight from the master: chaining through
+            # uneven steps (96 -> 72 -> 48 ...) visibly softens the small icons
+            master = masters[svg_path]
+            for size, output_paths in outputs:
+                if master.size == (size, size):
+                    # The master already comes out at the largest size, use it as is
+                    icon = master
+                else:
+                    icon = self.fit_icon(master, size, lanczos)
+                buffer = io.BytesIO()
+                icon.save(buffer, 'PNG', optimize=True)
+                yield buffer.getvalue(), output_paths
+
+    def fit_icon(self, img, size, resample):
+        """Scale an image to fit a size x size box, keeping its aspect ratio.
+
+        Non-square artwork is centered on a transparent square canvas.
+        """
+        fitted = ImageOps.contain(img, (size, size), resample)
+        if fitted.size == (size, size):
+            return fitted
+
+        icon = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        icon.paste(fitted, ((size - fitted.width) // 2, (size - fitted.height) // 2))
+        return icon
+
+    def write_icons(self, icons):
+        """Write (png_data, output_paths) icons, recompressing them with oxipng if installed.
+
+        oxipng runs in the background while the remaining icons are still being
+        produced. It is already a separate process, so threads are enough to
+        wait on it.
+        """
+        if not shutil.which('oxipng'):
+            for png_data, output_paths in icons:
+                self.write_icon(png_data, output_paths)
+            return
+
+        workers = min(os.cpu_count() or 1, MAX_RENDER_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = [(executor.submit(_optimize_png, png_data), output_paths) for png_data, output_paths in icons]
+            for future, output_paths in pending:
+                self.write_icon(future.result(), output_paths)
+
+    def notification_icon_jobs(self):
+        """List notification icon conversions using the foreground SVG."""
+        jobs = []
+        for folder, size in NOTIFICATION_SIZES.items():
+            # Use foreground SVG directly (already white and centered)
+            output_path = self.android_res / folder / "ic_notification.png"
+            jobs.append((self.foreground_svg_path, size, [output_path]))
 
-        # Notification icons need to be in drawable folders at specific sizes
-        notification_sizes = {
-            'drawable-mdpi': 24,
-            'drawable-hdpi': 36,
-            'drawable-xhdpi': 48,
-            'drawable-xxhdpi': 72,
-            'drawable-xxxhdpi': 96
-        }
+        return jobs
 
-        for folder, size in notification_sizes.items():
-            output_dir = self.android_res / folder
-            output_dir.mkdir(parents=True, exist_ok=True)
+    def linux_icon_jobs(self):
+        """List Linux desktop icon conversions using the main SVG."""
+        jobs = []
+        for size in LINUX_SIZES:
+            # Old naming (for compatibility) plus the flatpak naming convention
+            output_paths = [
+                self.linux_icons / f"nhac-{size}.png",
+                self.linux_icons / f"dev.myyc.nhac-{size}.png"
+            ]
+            if size == 256:
+                # Default icons without size suffix
+                output_paths += [self.linux_icons / "nhac.png", self.linux_icons / "dev.myyc.nhac.png"]
+            jobs.append((self.svg_path, size, output_paths))
 
-            # Use foreground SVG directly (already white and centered)
-            output_path = output_dir / "ic_notification.png"
-            self.convert_svg_to_png_path(self.foreground_svg_path, size, output_path)
+        return jobs
 
-        print("  ✅ Notification icons created!")
+    def finish_linux_icons(self):
+        """Copy the SVG icons and write the desktop file."""
+        self.log("\n🐧 Finishing Linux icons...")
 
-    def generate_linux_icons(self):
-        """Generate Linux desktop icons."""
-        print("\n🐧 Generating Linux icons...")
-        
-        for size in LINUX_SIZES:
-            # Create icons with old naming (for compatibility)
-            output_path = self.linux_icons / f"nhac-{size}.png"
-            self.convert_svg_to_png_path(self.svg_path, size, output_path)
-            print(f"  Created: {output_path}")
-
-            # Also create icons with flatpak naming convention
-            flatpak_path = self.linux_icons / f"dev.myyc.nhac-{size}.png"
-            shutil.copy(output_path, flatpak_path)
-            print(f"  Created: {flatpak_path}")
-        
-        # Create default icons without size suffix
-        shutil.copy(self.linux_icons / "nhac-256.png", self.linux_icons / "nhac.png")
-        shutil.copy(self.linux_icons / "nhac-256.png", self.linux_icons / "dev.myyc.nhac.png")
-        print(f"  Created: default icons (256x256)")
-        
-        # Copy SVG with both names
-        shutil.copy(self.svg_path, self.linux_icons / "nhac.svg")
-        shutil.copy(self.svg_path, self.linux_icons / "dev.myyc.nhac.svg")
+        # Copy SVG with both names. These stay real copies, not hardlinks: an
+        # in-place edit of one must not change the source asset.
+        for svg_copy in [self.linux_icons / "nhac.svg", self.linux_icons / "dev.myyc.nhac.svg"]:
+            if svg_copy.resolve() == self.svg_path.resolve():
+                continue
+            # Replace hardlinks left behind by earlier runs, they share the source's mtime
+            linked = svg_copy.exists() and os.path.samefile(self.svg_path, svg_copy)
+            if linked or self.needs_rebuild(self.svg_path, svg_copy):
+                svg_copy.unlink(missing_ok=True)
+                shutil.copy(self.svg_path, svg_copy)
         
         # Create desktop file
         desktop_file = self.project_root / "linux" / "nhac.desktop"
@@ -173,13 +467,15 @@ Icon=dev.myyc.nhac
 Terminal=false
 Categories=AudioVideo;Audio;Music;Player;
 StartupWMClass=Nhac'''
-        desktop_file.write_text(desktop_content)
+        # Only touch the file when its content changes, so downstream builds don't see it as dirty
+        if not desktop_file.exists() or desktop_file.read_text() != desktop_content:
+            desktop_file.write_text(desktop_content)
         
-        print("  ✅ Linux icons complete!")
+        self.log("  ✅ Linux icons complete!")
 
     def verify_results(self):
         """Verify the generated icons are correct."""
-        print("\n🔍 Verifying generated icons...")
+        self.log("\n🔍 Verifying generated icons...")
 
         # Check key files exist
         files_to_check = [
@@ -191,55 +487,63 @@ StartupWMClass=Nhac'''
         for file_path, name in files_to_check:
             full_path = self.android_res / file_path
             if full_path.exists():
-                print(f"  {name}: ✅ Created")
+                self.log(f"  {name}: ✅ Created")
             else:
-                print(f"  {name}: ⚠️ Missing")
+                self.log(f"  {name}: ⚠️ Missing")
 
         # Check colors.xml
         colors_file = self.android_res / "values" / "colors.xml"
         if colors_file.exists():
             content = colors_file.read_text()
             if self.background_color in content:
-                print(f"  Background color: ✅ {self.background_color}")
+                self.log(f"  Background color: ✅ {self.background_color}")
             else:
-                print(f"  Background color: ⚠️ Not set correctly")
+                self.log(f"  Background color: ⚠️ Not set correctly")
+
+        self.flush_log()
     
     def run(self):
         """Generate Linux and notification icons only."""
         try:
             self.setup()
 
-            print("=" * 50)
-            print("🎨 Linux & Notification Icon Generator")
-            print("=" * 50)
-
-            # Generate Linux icons (using circular nhac.svg)
-            self.generate_linux_icons()
-
-            # Generate Android notification icons (using fgnhac.svg)
-            self.create_notification_icon()
-
-            print("\n" + "=" * 50)
-            print("✅ Linux and notification icons generated successfully!")
-            print("=" * 50)
-            print("\nIcon configuration:")
-            print(f"  • Linux Icons: Using nhac.svg (circular icon)")
-            print(f"  • Android Notification: Using fgnhac.svg (white play buttons only)")
-            print(f"  • Launcher Icons: Generated by flutter_launcher_icons")
+            self.log("=" * 50)
+            self.log("🎨 Linux & Notification Icon Generator")
+            self.log("=" * 50)
+
+            # Linux icons use circular nhac.svg, Android notification icons use fgnhac.svg.
+            # All conversions are independent, so render them in one parallel batch.
+            self.log("\n🖌️  Rendering Linux and notification icons...")
+            self.render_icons(self.linux_icon_jobs() + self.notification_icon_jobs())
+            self.flush_log()
+
+            self.finish_linux_icons()
+            self.flush_log()
+
+            self.log("\n" + "=" * 50)
+            self.log("✅ Linux and notification icons generated successfully!")
+            self.log("=" * 50)
+            self.log("\nIcon configuration:")
+            self.log(f"  • Linux Icons: Using nhac.svg (circular icon)")
+            self.log(f"  • Android Notification: Using fgnhac.svg (white play buttons only)")
+            self.log(f"  • Launcher Icons: Generated by flutter_launcher_icons")
             
         finally:
-            self.cleanup()
+            self.flush_log()
 
 
 def main():
-    svg_path = sys.argv[1] if len(sys.argv) > 1 else None
+    parser = argparse.ArgumentParser(description="Generate Linux and notification icons from SVG sources.")
+    parser.add_argument('svg_path', nargs='?', help=f"main icon SVG (default: {DEFAULT_SVG})")
+    parser.add_argument('--force', action='store_true', help="regenerate outputs even if they are up to date")
+    args = parser.parse_args()
     
     try:
-        generator = IconGenerator(svg_path)
+        generator = IconGenerator(args.svg_path, force=args.force)
         generator.run()
     except FileNotFoundError as e:
         print(f"❌ Error: {e}")
-        print(f"\nUsage: {sys.argv[0]} [path/to/icon.svg]")
+        print(f"\nUsage: {sys.argv[0]} [--force] [path/to/icon.svg]")
         sys.exit(1)
     except Exception as e:
         print(f"❌ Error: {e}")